@@ -1,11 +1,151 @@
 from __future__ import annotations
 
+import csv
+import html
+import io
+import json
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from dataclasses import dataclass
-from typing import Iterable, List, Dict, Any
+from itertools import islice
+from typing import IO, Any, Deque, Dict, Iterable, Iterator, List, Mapping, Tuple, Union
 
 from calculator import StudyStatsCalculator
 
 
+# Summary keys produced by ``ReportGenerator.summarize_sessions``, in output order.
+SUMMARY_FIELDS: Tuple[str, ...] = (
+    "sessions",
+    "total_minutes",
+    "total_hours",
+    "avg_duration",
+    "median_duration",
+    "total_pages",
+    "pages_per_hour",
+    "avg_focus",
+)
+
+BULK_FORMATS: Tuple[str, ...] = ("text", "csv", "jsonl", "html")
+
+# Default ``parallel_threshold`` for ``ReportGenerator.write_summaries``.
+# In-process rendering handles roughly 200k text summaries per second, so
+# for smaller batches starting workers and pickling chunks to them is
+# unlikely to pay off. Callers with idle cores can lower it per call.
+PARALLEL_MIN_SUMMARIES = 200_000
+
+_HTML_HEADER = (
+    "<table>\n<thead><tr><th>label</th>"
+    + "".join(f"<th>{name}</th>" for name in SUMMARY_FIELDS)
+    + "</tr></thead>\n<tbody>\n"
+)
+_HTML_FOOTER = "</tbody>\n</table>\n"
+
+# Buffer size for files opened by ``ReportGenerator.write_summaries``.
+_WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def _template_values(summary: Mapping[str, Any]) -> Tuple[Any, ...]:
+    """Return the ``SUMMARY_FIELDS`` values of *summary*, with defaults.
+
+    All output formats go through this, so they agree on which fields
+    are written and on their types.
+    """
+    get = summary.get
+    return (
+        get("sessions", 0),
+        get("total_minutes", 0.0),
+        get("total_hours", 0.0),
+        get("avg_duration", 0.0),
+        get("median_duration", 0.0),
+        int(get("total_pages", 0)),
+        get("pages_per_hour", 0.0),
+        get("avg_focus", 0.0),
+    )
+
+
+def _format_text(summary: Mapping[str, Any]) -> str:
+    """Render one summary as the plain-text block of ``format_summary``."""
+    (
+        sessions,
+        total_minutes,
+        total_hours,
+        avg_duration,
+        median_duration,
+        total_pages,
+        pages_per_hour,
+        avg_focus,
+    ) = _template_values(summary)
+    return (
+        "Study Stats Summary\n"
+        "-------------------\n"
+        f"Sessions:               {sessions}\n"
+        f"Total time:             {total_minutes:.1f} minutes ({total_hours:.2f} h)\n"
+        f"Average session length: {avg_duration:.1f} minutes\n"
+        f"Median session length:  {median_duration:.1f} minutes\n"
+        f"Total pages:            {total_pages}\n"
+        f"Pages per hour:         {pages_per_hour:.2f}\n"
+        f"Average focus rating:   {avg_focus:.2f} / 10"
+    )
+
+
+def _format_html_row(label: str, summary: Mapping[str, Any]) -> str:
+    """Render one summary as an HTML table row."""
+    (
+        sessions,
+        total_minutes,
+        total_hours,
+        avg_duration,
+        median_duration,
+        total_pages,
+        pages_per_hour,
+        avg_focus,
+    ) = _template_values(summary)
+    return (
+        f"<tr><td>{html.escape(str(label))}</td><td>{sessions}</td>"
+        f"<td>{total_minutes:.1f}</td><td>{total_hours:.2f}</td>"
+        f"<td>{avg_duration:.1f}</td><td>{median_duration:.1f}</td>"
+        f"<td>{total_pages}</td><td>{pages_per_hour:.2f}</td>"
+        f"<td>{avg_focus:.2f}</td></tr>\n"
+    )
+
+
+def _render_chunk(fmt: str, chunk: List[Tuple[str, Mapping[str, Any]]]) -> str:
+    """Render labelled summaries as one string in the given format.
+
+    This is a module-level function so it can be sent to worker processes.
+    Headers and footers (CSV header row, HTML table) are not included.
+    """
+    if fmt == "text":
+        return "".join(f"[{label}]\n{_format_text(summary)}\n\n" for label, summary in chunk)
+    if fmt == "html":
+        return "".join(_format_html_row(label, summary) for label, summary in chunk)
+    if fmt == "jsonl":
+        dumps = json.dumps
+        return "".join(
+            dumps({"label": label, **dict(zip(SUMMARY_FIELDS, _template_values(summary)))})
+            + "\n"
+            for label, summary in chunk
+        )
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerows([label, *_template_values(summary)] for label, summary in chunk)
+        return buffer.getvalue()
+    raise ValueError(f"Unsupported report format: {fmt!r}")
+
+
+def _chunked(
+    items: Iterable[Tuple[str, Mapping[str, Any]]], size: int
+) -> Iterator[List[Tuple[str, Mapping[str, Any]]]]:
+    """Yield successive lists of at most *size* items."""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
 @dataclass
 class ReportGenerator:
     """Generate textual reports for StudyStats.
@@ -47,16 +187,106 @@ class ReportGenerator:
 
     def format_summary(self, summary: Dict[str, Any]) -> str:
         """Format the dictionary from ``summarize_sessions`` into text."""
-        lines = [
-            "Study Stats Summary",
-            "-------------------",
-            f"Sessions:               {summary.get('sessions', 0)}",
-            f"Total time:             {summary.get('total_minutes', 0.0):.1f} minutes"
-            f" ({summary.get('total_hours', 0.0):.2f} h)",
-            f"Average session length: {summary.get('avg_duration', 0.0):.1f} minutes",
-            f"Median session length:  {summary.get('median_duration', 0.0):.1f} minutes",
-            f"Total pages:            {int(summary.get('total_pages', 0))}",
-            f"Pages per hour:         {summary.get('pages_per_hour', 0.0):.2f}",
-            f"Average focus rating:   {summary.get('avg_focus', 0.0):.2f} / 10",
-        ]
-        return "\n".join(lines)
+        return _format_text(summary)
+
+    def write_summaries(
+        self,
+        summaries: Union[
+            Mapping[str, Mapping[str, Any]], Iterable[Tuple[str, Mapping[str, Any]]]
+        ],
+        out: Union[str, IO[str]],
+        fmt: str = "text",
+        workers: int = 1,
+        chunk_size: int = 1000,
+        parallel_threshold: int = PARALLEL_MIN_SUMMARIES,
+    ) -> int:
+        """Render many labelled summaries and write them in one pass.
+
+        Args:
+            summaries: Mapping of label (e.g. user id or time bucket) to a
+                summary from ``summarize_sessions``, or an iterable of
+                ``(label, summary)`` pairs.
+            out: Output path, or a text file object opened for writing.
+                Paths are opened with a large write buffer. Every format,
+                CSV included, ends lines with ``"\n"``, so file objects
+                need no special ``newline`` setting.
+            fmt: One of ``"text"``, ``"csv"``, ``"jsonl"`` or ``"html"``.
+            workers: Number of processes used for rendering. With more
+                than one, the first *parallel_threshold* summaries are
+                still rendered in-process, and only the rest of the
+                batch goes to a process pool. Output stays in input
+                order, and only a few chunks are held in memory at a
+                time. Rendering is cheap, so the default of one process
+                is usually fastest; measure before raising it.
+            chunk_size: Number of summaries rendered per chunk.
+            parallel_threshold: Number of summaries rendered in-process
+                before the pool is started. Pass ``0`` to use the pool
+                for the whole batch, e.g. for nightly runs of tens of
+                thousands of summaries on a machine with idle cores.
+
+        Returns:
+            Number of summaries written.
+        """
+        if fmt not in BULK_FORMATS:
+            raise ValueError(f"Unsupported report format: {fmt!r}")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if parallel_threshold < 0:
+            raise ValueError("parallel_threshold must not be negative")
+
+        items = summaries.items() if isinstance(summaries, Mapping) else summaries
+        counted: List[int] = []
+
+        def chunks() -> Iterator[List[Tuple[str, Mapping[str, Any]]]]:
+            for chunk in _chunked(items, chunk_size):
+                counted.append(len(chunk))
+                yield chunk
+
+        if isinstance(out, str):
+            with open(out, "w", encoding="utf-8", newline="", buffering=_WRITE_BUFFER_SIZE) as f:
+                self._write_chunks(f, chunks(), fmt, workers, parallel_threshold)
+        else:
+            self._write_chunks(out, chunks(), fmt, workers, parallel_threshold)
+        return sum(counted)
+
+    @staticmethod
+    def _write_chunks(
+        f: IO[str],
+        chunks: Iterable[List[Tuple[str, Mapping[str, Any]]]],
+        fmt: str,
+        workers: int,
+        parallel_threshold: int,
+    ) -> None:
+        """Write header, rendered chunks and footer for *fmt* to *f*."""
+        if fmt == "csv":
+            csv.writer(f, lineterminator="\n").writerow(["label", *SUMMARY_FIELDS])
+        elif fmt == "html":
+            f.write(_HTML_HEADER)
+
+        # Render in-process first; a pool is only started once the batch
+        # has reached *parallel_threshold* and more chunks remain.
+        chunk_iter = iter(chunks)
+        rendered = 0
+        use_pool = workers > 1 and parallel_threshold == 0
+        if not use_pool:
+            for chunk in chunk_iter:
+                f.write(_render_chunk(fmt, chunk))
+                rendered += len(chunk)
+                if workers > 1 and rendered >= parallel_threshold:
+                    use_pool = True
+                    break
+
+        if use_pool:
+            # Keep only a small window of chunks in flight and write each
+            # result as soon as it is next in order, so memory stays bounded.
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending: Deque[Future] = deque()
+                for chunk in chunk_iter:
+                    pending.append(executor.submit(_render_chunk, fmt, chunk))
+                    if len(pending) >= 2 * workers:
+                        f.write(pending.popleft().result())
+                while pending:
+                    f.write(pending.popleft().result())
+
+        if fmt == "html":
+            f.write(_HTML_FOOTER)
@@ -6,7 +6,7 @@ HTTP APIs and simple data processing utilities.
 Public modules of interest:
 
 - :mod:`api_playground` – simple API client wrapper
-- :mod:`data_processing` – helpers for converting and filtering API data
+- :mod:`data_processing` – helpers for converting, filtering and joining API data
 - :mod:`utils.logger` – preconfigured logger for consistent logging
 """
 
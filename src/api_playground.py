@@ -8,9 +8,10 @@ predictable behavior rather than feature completeness.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Mapping, Optional
+from typing import IO, Any, Dict, Mapping, Optional, Union
 
 import requests
+import urllib3.exceptions
 from requests import Response
 
 from .utils.logger import get_logger
@@ -18,6 +19,12 @@ from .utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+#: Maximum number of body bytes included in error messages.
+ERROR_SNIPPET_BYTES = 200
+
+#: Default chunk size (in bytes) used when streaming response bodies.
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
 
 class ApiPlaygroundError(Exception):
     """Base exception for ApiPlayground-related errors."""
@@ -47,12 +54,20 @@ class ApiPlayground:
         are merged on top of these.
     session:
         Optional preconfigured :class:`requests.Session` instance.
+    accept_encoding:
+        Optional ``Accept-Encoding`` value sent unless a request or
+        ``default_headers`` sets one, e.g. ``"identity"`` to disable
+        compression. If omitted, the session's own header is used; for a
+        default session requests already negotiates gzip and deflate, plus
+        brotli and zstd when urllib3 can decode them
+        (``requests.utils.DEFAULT_ACCEPT_ENCODING``).
     """
 
     base_url: str
     default_timeout: int = 10
     default_headers: Mapping[str, str] = field(default_factory=dict)
     session: Optional[requests.Session] = None
+    accept_encoding: Optional[str] = None
 
     def __post_init__(self) -> None:
         # Normalize base_url (no trailing slash)
@@ -118,6 +133,108 @@ class ApiPlayground:
             timeout=timeout,
         )
 
+    def get_bytes(
+        self,
+        path: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[int] = None,
+    ) -> bytes:
+        """Perform a GET request and return the raw (decompressed) body.
+
+        Unlike :meth:`get`, the body is never decoded to text or parsed
+        as JSON, which avoids an extra copy for binary payloads or data
+        handed straight to another parser.
+        """
+
+        response = self._send(
+            method="GET",
+            path=path,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+        )
+        return response.content
+
+    def download(
+        self,
+        path: str,
+        dest: Union[IO[bytes], bytearray, memoryview],
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> int:
+        """Stream a GET response body into *dest* and return its size.
+
+        Parameters
+        ----------
+        dest:
+            Either a writable binary file object, or a preallocated
+            writable buffer (``bytearray`` or ``memoryview``). Buffers
+            are filled in place. A :class:`ValueError` is raised before
+            the request is sent if the buffer is read-only or not
+            C-contiguous, and while reading if the body does not fit.
+        chunk_size:
+            Number of bytes requested from the connection per read.
+            Decompressed chunks may be larger.
+
+        Notes
+        -----
+        The body is streamed chunk by chunk and decompressed on the fly,
+        so it is never held in memory as a whole. Each chunk is a
+        ``bytes`` object that is written to the file, or copied into the
+        buffer through a :class:`memoryview` slice.
+        """
+
+        view: Optional[memoryview] = None
+        if isinstance(dest, (bytearray, memoryview)):
+            view = memoryview(dest)
+            if view.readonly:
+                raise ValueError("download() needs a writable buffer, got a read-only one")
+            if not view.c_contiguous:
+                raise ValueError("download() needs a C-contiguous buffer")
+            view = view.cast("B")
+
+        response = self._send(
+            method="GET",
+            path=path,
+            params=params,
+            headers=headers,
+            timeout=timeout,
+            stream=True,
+        )
+
+        written = 0
+        try:
+            chunks = response.raw.stream(chunk_size, decode_content=True)
+            if view is not None:
+                for chunk in chunks:
+                    end = written + len(chunk)
+                    if end > len(view):
+                        raise ValueError(
+                            f"Response body does not fit into a buffer of {len(view)} bytes"
+                        )
+                    view[written:end] = chunk
+                    written = end
+            else:
+                for chunk in chunks:
+                    dest.write(chunk)
+                    written += len(chunk)
+        except urllib3.exceptions.HTTPError as exc:
+            logger.error(
+                "HTTP download failed while reading body",
+                extra={"path": path, "bytes": written, "error": str(exc)},
+            )
+            raise HttpRequestError(
+                f"Error while reading response body: {exc}", response=response
+            ) from exc
+        finally:
+            response.close()
+
+        logger.debug("Downloaded response body", extra={"bytes": written})
+        return written
+
     def _request(
         self,
         method: str,
@@ -128,7 +245,36 @@ class ApiPlayground:
         headers: Optional[Mapping[str, str]] = None,
         timeout: Optional[int] = None,
     ) -> Any:
-        """Internal helper to perform an HTTP request.
+        """Internal helper to perform an HTTP request and decode it.
+
+        See :meth:`_send` for the errors raised.
+        """
+
+        response = self._send(
+            method=method,
+            path=path,
+            params=params,
+            json=json,
+            data=data,
+            headers=headers,
+            timeout=timeout,
+        )
+        return self._decode_response(response)
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Mapping[str, Any]] = None,
+        json: Optional[Any] = None,
+        data: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[int] = None,
+        stream: bool = False,
+    ) -> Response:
+        """Perform an HTTP request and return the checked response.
+
+        With ``stream=True`` the body is left unread for the caller.
 
         Raises
         ------
@@ -147,6 +293,10 @@ class ApiPlayground:
         request_headers: Dict[str, str] = dict(self.default_headers)
         if headers:
             request_headers.update(headers)
+        if self.accept_encoding is not None and not any(
+            name.lower() == "accept-encoding" for name in request_headers
+        ):
+            request_headers["Accept-Encoding"] = self.accept_encoding
 
         logger.info("Performing HTTP request", extra={"method": method, "url": url})
 
@@ -159,6 +309,7 @@ class ApiPlayground:
                 data=data,
                 headers=request_headers,
                 timeout=timeout_value,
+                stream=stream,
             )
         except requests.RequestException as exc:  # network/connection errors
             logger.error(
@@ -174,11 +325,11 @@ class ApiPlayground:
             )
             message = (
                 f"Request to {url} failed with status "
-                f"{response.status_code}: {response.text[:200]}"
+                f"{response.status_code}: {self._error_snippet(response, stream)}"
             )
             raise HttpRequestError(message, response=response)
 
-        return self._decode_response(response)
+        return response
 
     # ------------------------------------------------------------------
     # Helpers
@@ -192,6 +343,34 @@ class ApiPlayground:
             path = "/" + path
         return f"{self.base_url}{path}"
 
+    @staticmethod
+    def _error_snippet(response: Response, streamed: bool) -> str:
+        """Return at most ``ERROR_SNIPPET_BYTES`` of the body as text.
+
+        Only the snippet is decoded, not the whole body. For streamed
+        responses at most that many bytes are read from the socket, and
+        the connection is always released; if that read fails, the
+        snippet is empty so the caller still reports the status code.
+        """
+
+        if streamed:
+            try:
+                snippet = next(response.iter_content(ERROR_SNIPPET_BYTES), b"")
+            except requests.RequestException as exc:
+                logger.debug(
+                    "Could not read error response body",
+                    extra={"status_code": response.status_code, "error": str(exc)},
+                )
+                snippet = b""
+            finally:
+                response.close()
+        else:
+            snippet = response.content[:ERROR_SNIPPET_BYTES]
+        try:
+            return snippet.decode(response.encoding or "utf-8", errors="replace")
+        except LookupError:  # unknown charset declared by the server
+            return snippet.decode("utf-8", errors="replace")
+
     @staticmethod
     def _decode_response(response: Response) -> Any:
         """Decode an HTTP response.
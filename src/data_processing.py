@@ -7,7 +7,20 @@ returned from web APIs. They are intentionally minimal yet explicit,
 serving mainly as examples that can be extended for real-world use.
 """
 
-from typing import Any, Callable, Iterable, List, Mapping, Sequence
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import pandas as pd
 
@@ -70,3 +83,387 @@ def head_as_dicts(df: pd.DataFrame, n: int = 5) -> List[dict]:
     """
 
     return df.head(n).to_dict(orient="records")
+
+
+def iter_records(data: Any) -> Iterator[dict]:
+    """Yield plain dict records from a DataFrame or iterable of mappings.
+
+    DataFrames are converted row by row; mappings are passed through as
+    dicts. A single mapping is treated as a one-record stream, mirroring
+    :func:`to_dataframe`.
+    """
+
+    if isinstance(data, pd.DataFrame):
+        columns = list(data.columns)
+        for row in data.itertuples(index=False, name=None):
+            yield dict(zip(columns, row))
+        return
+
+    if isinstance(data, Mapping):
+        data = [data]
+
+    for record in data:
+        yield dict(record)
+
+
+class RecordIndex:
+    """In-memory hash index over records keyed on one or more columns.
+
+    The index is built once and then supports O(1) point lookups, batch
+    lookups and hash joins. This replaces repeated calls to
+    :func:`filter_rows` when enriching one API result set with another,
+    e.g. joining users onto posts.
+
+    Parameters
+    ----------
+    on:
+        Column name, or sequence of column names, used as the key. With a
+        single column, keys are plain values; with several columns, keys
+        are tuples in the given column order.
+
+    Examples
+    --------
+    >>> users = RecordIndex.build(api.get("/users"), on="id")
+    >>> users.get(1)
+    [{'id': 1, 'name': 'Leanne Graham', ...}]
+    >>> enriched = users.join_dataframe(posts_df, left_on="userId")
+    """
+
+    def __init__(self, on: Union[str, Sequence[str]]) -> None:
+        if isinstance(on, str):
+            key_columns = [on]
+        else:
+            key_columns = list(on)
+        if not key_columns:
+            raise ValueError("RecordIndex requires at least one key column")
+
+        self.key_columns: List[str] = key_columns
+        self._buckets: Dict[Hashable, List[dict]] = {}
+        # Ordered set of every column seen, used to pad unmatched left joins.
+        self._columns: Dict[str, None] = {}
+
+    @classmethod
+    def build(cls, data: Any, on: Union[str, Sequence[str]]) -> "RecordIndex":
+        """Build an index over a DataFrame or iterable of records."""
+
+        index = cls(on)
+        index.add(data)
+        return index
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+    def add(self, data: Any) -> None:
+        """Add records from a DataFrame or iterable of mappings.
+
+        Records missing any key column raise a :class:`KeyError`; records
+        whose key value is unhashable (e.g. a list or dict from a JSON
+        payload) raise a :class:`ValueError` naming the column.
+        Duplicate keys are allowed; all matching records are kept in
+        insertion order.
+        """
+
+        buckets = self._buckets
+        columns = self._columns
+        for record in iter_records(data):
+            key = self._key_of(record, self.key_columns)
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [record]
+            else:
+                bucket.append(record)
+            for column in record:
+                if column not in columns:
+                    columns[column] = None
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._buckets
+
+    def keys(self) -> List[Hashable]:
+        """Return the distinct keys in insertion order."""
+
+        return list(self._buckets)
+
+    def get(self, key: Hashable) -> List[dict]:
+        """Return all records matching *key* (empty list if none)."""
+
+        return list(self._buckets.get(key, ()))
+
+    def get_one(self, key: Hashable, default: Optional[dict] = None) -> Optional[dict]:
+        """Return the first record matching *key*, or *default*."""
+
+        bucket = self._buckets.get(key)
+        return bucket[0] if bucket else default
+
+    def get_many(self, keys: Iterable[Hashable]) -> Dict[Hashable, List[dict]]:
+        """Look up several keys at once.
+
+        Keys with no match are omitted from the result.
+        """
+
+        buckets = self._buckets
+        return {key: list(buckets[key]) for key in keys if key in buckets}
+
+    # ------------------------------------------------------------------
+    # Joins
+    # ------------------------------------------------------------------
+    def join(
+        self,
+        records: Any,
+        left_on: Optional[Union[str, Sequence[str]]] = None,
+        how: str = "inner",
+        suffix: str = "_right",
+        left_columns: Optional[Sequence[str]] = None,
+    ) -> Iterator[dict]:
+        """Hash-join *records* lazily against the index, yielding merged dicts.
+
+        Records are read one at a time, so a one-shot iterator (e.g.
+        pages coming out of an API) is never held in memory, provided
+        ``left_columns`` is given for it.
+
+        Every output record uses the same column names: which indexed
+        columns clash with the left side is decided once per call, from
+        the left schema, not per record.
+
+        Parameters
+        ----------
+        records:
+            Left-hand side records (DataFrame or iterable of mappings).
+        left_on:
+            Key column(s) on the left side. Defaults to the index key
+            columns. Must have the same length as ``key_columns``.
+        how:
+            ``"inner"`` drops left records without a match; ``"left"``
+            keeps them, filling indexed columns with ``None``. Left
+            records with a missing or unhashable key never match.
+        suffix:
+            Appended to indexed column names that clash with a left
+            column. Key columns shared by both sides are not duplicated.
+        left_columns:
+            Every column of the left side. Defaults to the DataFrame
+            columns, or to the union of keys of a list or tuple of
+            records. Required for any other iterable, since its schema
+            cannot be known without reading it. It should list every
+            left column:
+            a record with an unlisted column that clashes still gets a
+            suffixed name, so no left value is overwritten.
+        """
+
+        left_keys = self._left_key_columns(left_on, how)
+        if left_columns is None:
+            records, left_columns = self._with_schema(records)
+        renames = self._right_renames(left_keys, left_columns, suffix)
+        return self._join(records, left_keys, how, renames, suffix)
+
+    def join_dataframe(
+        self,
+        df: Any,
+        left_on: Optional[Union[str, Sequence[str]]] = None,
+        how: str = "inner",
+        suffix: str = "_right",
+    ) -> pd.DataFrame:
+        """Hash-join *df* against the index and return a new DataFrame.
+
+        *df* may also be a list or tuple of records. The result always has the
+        full output columns, even when no rows match. See :meth:`join`
+        for the meaning of the parameters.
+        """
+
+        left_keys = self._left_key_columns(left_on, how)
+        records, left_columns = self._with_schema(df)
+        renames = self._right_renames(left_keys, left_columns, suffix)
+        columns = list(left_columns)
+        seen = set(columns)
+        columns.extend(name for name in renames.values() if name not in seen)
+        return pd.DataFrame.from_records(
+            list(self._join(records, left_keys, how, renames, suffix)), columns=columns
+        )
+
+    def join_chunks(
+        self,
+        chunks: Iterable[Any],
+        left_on: Optional[Union[str, Sequence[str]]] = None,
+        how: str = "inner",
+        suffix: str = "_right",
+    ) -> Iterator[pd.DataFrame]:
+        """Join each chunk of *chunks* and yield one DataFrame per chunk.
+
+        Each chunk may be a DataFrame or a list of records, e.g. one page
+        of API results, so large result sets never need to be held in
+        memory at once.
+        """
+
+        for chunk in chunks:
+            yield self.join_dataframe(chunk, left_on=left_on, how=how, suffix=suffix)
+
+    def _join(
+        self,
+        records: Any,
+        left_keys: Sequence[str],
+        how: str,
+        renames: Mapping[str, str],
+        suffix: str,
+    ) -> Iterator[dict]:
+        """Yield merged records; see :meth:`join`."""
+
+        buckets = self._buckets
+        padding = dict.fromkeys(self._columns)
+
+        for left in iter_records(records):
+            try:
+                key = self._key_of(left, left_keys)
+            except (KeyError, ValueError):
+                matches = None
+            else:
+                matches = buckets.get(key)
+
+            if matches:
+                for right in matches:
+                    yield self._merge(left, right, renames, suffix)
+            elif how == "left":
+                yield self._merge(left, padding, renames, suffix)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _key_of(record: Mapping[str, Any], columns: Sequence[str]) -> Hashable:
+        """Extract the (possibly composite) key of *record*.
+
+        Raises
+        ------
+        KeyError
+            If a key column is missing from *record*.
+        ValueError
+            If a key value is unhashable, e.g. a list or dict.
+        """
+
+        if len(columns) == 1:
+            key = record[columns[0]]
+        else:
+            key = tuple(record[column] for column in columns)
+
+        try:
+            hash(key)
+        except TypeError:
+            for column in columns:
+                value = record[column]
+                try:
+                    hash(value)
+                except TypeError:
+                    raise ValueError(
+                        f"Key column {column!r} holds an unhashable "
+                        f"{type(value).__name__} value"
+                    ) from None
+            raise
+        return key
+
+    def _left_key_columns(
+        self, left_on: Optional[Union[str, Sequence[str]]], how: str
+    ) -> List[str]:
+        """Validate join arguments and return the left key columns."""
+
+        if how not in ("inner", "left"):
+            raise ValueError(f"Unsupported join type: {how!r}")
+
+        if left_on is None:
+            left_keys = list(self.key_columns)
+        elif isinstance(left_on, str):
+            left_keys = [left_on]
+        else:
+            left_keys = list(left_on)
+        if len(left_keys) != len(self.key_columns):
+            raise ValueError("left_on must have the same number of columns as the index key")
+        return left_keys
+
+    @staticmethod
+    def _with_schema(records: Any) -> Tuple[Any, List[str]]:
+        """Return *records* and their columns, without reading iterators.
+
+        Raises
+        ------
+        ValueError
+            If *records* is a one-shot iterable whose columns could only
+            be found by consuming it.
+        """
+
+        if isinstance(records, pd.DataFrame):
+            return records, list(records.columns)
+        if isinstance(records, Mapping):
+            records = [records]
+        if not isinstance(records, (list, tuple)):
+            raise ValueError(
+                "left_columns is required to join records that are not a "
+                "DataFrame, list or tuple"
+            )
+
+        columns: Dict[str, None] = {}
+        for record in records:
+            for column in record:
+                if column not in columns:
+                    columns[column] = None
+        return records, list(columns)
+
+    def _right_renames(
+        self, left_keys: Sequence[str], left_columns: Iterable[str], suffix: str
+    ) -> Dict[str, str]:
+        """Map each indexed column to its output name.
+
+        Right-side key columns joined on a same-named left column carry
+        identical values, so they are left out of the mapping. A clashing
+        column gets *suffix* appended, repeatedly if the suffixed name is
+        itself taken by a left column or another indexed column.
+        """
+
+        if not suffix:
+            raise ValueError("suffix must be a non-empty string")
+
+        shared_keys = {
+            right for left, right in zip(left_keys, self.key_columns) if left == right
+        }
+        right_columns = [column for column in self._columns if column not in shared_keys]
+        taken = set(left_columns)
+        clashing = {column for column in right_columns if column in taken}
+        taken.update(column for column in right_columns if column not in clashing)
+
+        renames: Dict[str, str] = {}
+        for column in right_columns:
+            name = column
+            if column in clashing:
+                name = f"{column}{suffix}"
+                while name in taken:
+                    name = f"{name}{suffix}"
+                taken.add(name)
+            renames[column] = name
+        return renames
+
+    @staticmethod
+    def _merge(
+        left: Mapping[str, Any],
+        right: Mapping[str, Any],
+        renames: Mapping[str, str],
+        suffix: str,
+    ) -> dict:
+        """Merge a right-hand record into a copy of a left-hand record.
+
+        *renames* maps right-side columns to output names; columns not in
+        it are dropped. *suffix* only guards clashes with left columns
+        that were missing from the declared left schema, so that no left
+        value is ever overwritten.
+        """
+
+        merged = dict(left)
+        for column, value in right.items():
+            name = renames.get(column)
+            if name is None:
+                continue
+            while name in merged:
+                name = f"{name}{suffix}"
+            merged[name] = value
+        return merged